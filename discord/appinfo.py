@@ -185,39 +185,44 @@ class AppInfo:
     def __init__(self, state: ConnectionState, data: AppInfoPayload):
         from .team import Team
 
+        # Bound once; this constructor does over a dozen optional lookups
+        get = data.get
+
         self._state: ConnectionState = state
         self.id: int = int(data['id'])
         self.name: str = data['name']
         self.description: str = data['description']
         self._icon: Optional[str] = data['icon']
-        self.rpc_origins: Optional[List[str]] = data.get('rpc_origins')
+        self.rpc_origins: Optional[List[str]] = get('rpc_origins')
         self.bot_public: bool = data['bot_public']
         self.bot_require_code_grant: bool = data['bot_require_code_grant']
         self.owner: User = state.create_user(data['owner'])
 
-        team: Optional[TeamPayload] = data.get('team')
+        team: Optional[TeamPayload] = get('team')
         self.team: Optional[Team] = Team(state, team) if team else None
 
         self.verify_key: str = data['verify_key']
 
-        self.guild_id: Optional[int] = utils._get_as_snowflake(data, 'guild_id')
-
-        self.primary_sku_id: Optional[int] = utils._get_as_snowflake(data, 'primary_sku_id')
-        self.slug: Optional[str] = data.get('slug')
-        self._flags: int = data.get('flags', 0)
-        self._cover_image: Optional[str] = data.get('cover_image')
-        self.terms_of_service_url: Optional[str] = data.get('terms_of_service_url')
-        self.privacy_policy_url: Optional[str] = data.get('privacy_policy_url')
-        self.tags: List[str] = data.get('tags', [])
-        self.custom_install_url: Optional[str] = data.get('custom_install_url')
-        self.role_connections_verification_url: Optional[str] = data.get('role_connections_verification_url')
-
-        params = data.get('install_params')
+        guild_id = get('guild_id')
+        self.guild_id: Optional[int] = int(guild_id) if guild_id is not None else None
+
+        primary_sku_id = get('primary_sku_id')
+        self.primary_sku_id: Optional[int] = int(primary_sku_id) if primary_sku_id else None
+        self.slug: Optional[str] = get('slug')
+        self._flags: int = get('flags', 0)
+        self._cover_image: Optional[str] = get('cover_image')
+        self.terms_of_service_url: Optional[str] = get('terms_of_service_url')
+        self.privacy_policy_url: Optional[str] = get('privacy_policy_url')
+        self.tags: List[str] = get('tags', [])
+        self.custom_install_url: Optional[str] = get('custom_install_url')
+        self.role_connections_verification_url: Optional[str] = get('role_connections_verification_url')
+
+        params = get('install_params')
         self.install_params: Optional[AppInstallParams] = AppInstallParams(params) if params else None
-        self.interactions_endpoint_url: Optional[str] = data.get('interactions_endpoint_url')
-        self.redirect_uris: List[str] = data.get('redirect_uris', [])
-        self.approximate_guild_count: int = data.get('approximate_guild_count', 0)
-        self.approximate_user_install_count: Optional[int] = data.get('approximate_user_install_count')
+        self.interactions_endpoint_url: Optional[str] = get('interactions_endpoint_url')
+        self.redirect_uris: List[str] = get('redirect_uris', [])
+        self.approximate_guild_count: int = get('approximate_guild_count', 0)
+        self.approximate_user_install_count: Optional[int] = get('approximate_user_install_count')
 
     def __repr__(self) -> str:
         return (
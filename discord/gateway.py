@@ -43,6 +43,7 @@ from . import utils
 from .activity import BaseActivity
 from .enums import SpeakingState
 from .errors import ConnectionClosed
+from .utils import _from_json, _to_json
 
 _log = logging.getLogger(__name__)
 
@@ -95,13 +96,13 @@ class GatewayRatelimiter:
         self.shard_id: Optional[int] = None
 
     def is_ratelimited(self) -> bool:
-        current = time.time()
+        current = time.monotonic()
         if current > self.window + self.per:
             return False
         return self.remaining == 0
 
     def get_delay(self) -> float:
-        current = time.time()
+        current = time.monotonic()
 
         if current > self.window + self.per:
             self.remaining = self.max
@@ -148,6 +149,7 @@ class KeepAliveHandler(threading.Thread):
         self._last_recv: float = time.perf_counter()
         self.latency: float = float('inf')
         self.heartbeat_timeout: float = ws._max_heartbeat_timeout
+        self._heartbeat_payload: Dict[str, Any] = {'op': ws.HEARTBEAT, 'd': None}
 
     def run(self) -> None:
         while not self._stop_ev.wait(self.interval):
@@ -155,14 +157,9 @@ class KeepAliveHandler(threading.Thread):
                 _log.warning("Shard ID %s has stopped responding to the gateway. Closing and restarting.", self.shard_id)
                 coro = self.ws.close(4000)
                 f = asyncio.run_coroutine_threadsafe(coro, loop=self.ws.loop)
-
-                try:
-                    f.result()
-                except Exception:
-                    _log.exception('An error occurred while stopping the gateway. Ignoring.')
-                finally:
-                    self.stop()
-                    return
+                f.add_done_callback(self._on_close_done)
+                self.stop()
+                return
 
             data = self.get_payload()
             _log.debug(self.msg, self.shard_id, data['d'])
@@ -191,11 +188,16 @@ class KeepAliveHandler(threading.Thread):
             else:
                 self._last_send = time.perf_counter()
 
+    def _on_close_done(self, future: concurrent.futures.Future[Any]) -> None:
+        try:
+            future.result()
+        except Exception:
+            _log.exception('An error occurred while stopping the gateway. Ignoring.')
+
     def get_payload(self) -> Dict[str, Any]:
-        return {
-            'op': self.ws.HEARTBEAT,
-            'd': self.ws.sequence,
-        }
+        # Reused across heartbeats; the payload is serialized before the next tick
+        self._heartbeat_payload['d'] = self.ws.sequence
+        return self._heartbeat_payload
 
     def stop(self) -> None:
         self._stop_ev.set()
@@ -221,10 +223,9 @@ class VoiceKeepAliveHandler(KeepAliveHandler):
         self.behind_msg: str = 'High socket latency, shard ID %s heartbeat is %.1fs behind'
 
     def get_payload(self) -> Dict[str, Any]:
-        return {
-            'op': self.ws.HEARTBEAT,
-            'd': int(time.time() * 1000),
-        }
+        # As with the base handler, the payload dict is reused across ticks
+        self._heartbeat_payload['d'] = int(time.time() * 1000)
+        return self._heartbeat_payload
 
     def ack(self) -> None:
         ack_time = time.perf_counter()
@@ -241,6 +242,11 @@ class DiscordClientWebSocketResponse(aiohttp.ClientWebSocketResponse):
 
 DWS = TypeVar('DWS', bound='DiscordWebSocket')
 
+# Compressed frames above this size are inflated off the event loop;
+# READY on large bots can take tens of milliseconds to decompress, which
+# would otherwise stall heartbeats and every other task on the loop.
+_SYNC_DECOMPRESS_THRESHOLD = 32 * 1024
+
 
 class DiscordWebSocket:
     """Implements a WebSocket for Discord's gateway v10.
@@ -310,14 +316,20 @@ class DiscordWebSocket:
     GUILD_SYNC                  = 12
     # fmt: on
 
+    IDENTIFY_PROPERTIES: Dict[str, Any] = {
+        'os': sys.platform,
+        'browser': 'discord.py',
+        'device': 'discord.py',
+    }
+
     def __init__(self, socket: aiohttp.ClientWebSocketResponse, *, loop: asyncio.AbstractEventLoop) -> None:
         self.socket: aiohttp.ClientWebSocketResponse = socket
         self.loop: asyncio.AbstractEventLoop = loop
 
         # an empty dispatcher to prevent crashes
         self._dispatch: Callable[..., Any] = lambda *args: None
-        # generic event listeners
-        self._dispatch_listeners: List[EventListener] = []
+        # generic event listeners, bucketed by event name
+        self._dispatch_listeners: Dict[str, List[EventListener]] = {}
         # the keep alive
         self._keep_alive: Optional[KeepAliveHandler] = None
         self.thread_id: int = threading.get_ident()
@@ -336,10 +348,13 @@ class DiscordWebSocket:
     def is_ratelimited(self) -> bool:
         return self._rate_limiter.is_ratelimited()
 
-    def debug_log_receive(self, data: Dict[str, Any], /) -> None:
+    def debug_log_receive(self, data: Any, /) -> None:
+        # The documented contract for on_socket_raw_receive is a str
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
         self._dispatch('socket_raw_receive', data)
 
-    def log_receive(self, _: Dict[str, Any], /) -> None:
+    def log_receive(self, _: Any, /) -> None:
         pass
 
     @classmethod
@@ -435,7 +450,7 @@ class DiscordWebSocket:
 
         future = self.loop.create_future()
         entry = EventListener(event=event, predicate=predicate, result=result, future=future)
-        self._dispatch_listeners.append(entry)
+        self._dispatch_listeners.setdefault(event, []).append(entry)
         return future
 
     async def identify(self) -> None:
@@ -444,11 +459,7 @@ class DiscordWebSocket:
             'op': self.IDENTIFY,
             'd': {
                 'token': self.token,
-                'properties': {
-                    'os': sys.platform,
-                    'browser': 'discord.py',
-                    'device': 'discord.py',
-                },
+                'properties': self.IDENTIFY_PROPERTIES,
                 'compress': True,
                 'large_threshold': 250,
             },
@@ -489,14 +500,19 @@ class DiscordWebSocket:
 
     async def received_message(self, msg: Any, /) -> None:
         if type(msg) is bytes:
-            msg = self._decompressor.decompress(msg)
+            # This is safe to offload since poll_event awaits each message in
+            # order, so the decompression context is never used concurrently
+            if len(msg) >= _SYNC_DECOMPRESS_THRESHOLD:
+                msg = await self.loop.run_in_executor(None, self._decompressor.decompress, msg)
+            else:
+                msg = self._decompressor.decompress(msg)
 
             # Received a partial gateway message
             if msg is None:
                 return
 
         self.log_receive(msg)
-        msg = utils._from_json(msg)
+        msg = _from_json(msg)
 
         _log.debug('For Shard ID %s: WebSocket Event: %s', self.shard_id, msg)
         event = msg.get('t')
@@ -573,30 +589,33 @@ class DiscordWebSocket:
         else:
             func(data)
 
-        # remove the dispatched listeners
-        removed = []
-        for index, entry in enumerate(self._dispatch_listeners):
-            if entry.event != event:
-                continue
+        # only the listeners waiting on this event need to be resolved,
+        # keeping the unresolved ones in a single pass
+        listeners = self._dispatch_listeners.get(event)
+        if not listeners:
+            return
 
+        keep: List[EventListener] = []
+        for entry in listeners:
             future = entry.future
             if future.cancelled():
-                removed.append(index)
                 continue
 
             try:
                 valid = entry.predicate(data)
             except Exception as exc:
                 future.set_exception(exc)
-                removed.append(index)
             else:
                 if valid:
                     ret = data if entry.result is None else entry.result(data)
                     future.set_result(ret)
-                    removed.append(index)
+                else:
+                    keep.append(entry)
 
-        for index in reversed(removed):
-            del self._dispatch_listeners[index]
+        if keep:
+            self._dispatch_listeners[event] = keep
+        else:
+            del self._dispatch_listeners[event]
 
     @property
     def latency(self) -> float:
@@ -660,7 +679,7 @@ class DiscordWebSocket:
 
     async def send_as_json(self, data: Any) -> None:
         try:
-            await self.send(utils._to_json(data))
+            await self.send(_to_json(data))
         except RuntimeError as exc:
             if not self._can_handle_close():
                 raise ConnectionClosed(self.socket, shard_id=self.shard_id) from exc
@@ -668,7 +687,7 @@ class DiscordWebSocket:
     async def send_heartbeat(self, data: Any) -> None:
         # This bypasses the rate limit handling code since it has a higher priority
         try:
-            await self.socket.send_str(utils._to_json(data))
+            await self.socket.send_str(_to_json(data))
         except RuntimeError as exc:
             if not self._can_handle_close():
                 raise ConnectionClosed(self.socket, shard_id=self.shard_id) from exc
@@ -700,7 +719,7 @@ class DiscordWebSocket:
             },
         }
 
-        sent = utils._to_json(payload)
+        sent = _to_json(payload)
         _log.debug('Sending "%s" to change status', sent)
         await self.send(sent)
 
@@ -838,7 +857,7 @@ class DiscordVoiceWebSocket:
 
     async def send_as_json(self, data: Any) -> None:
         _log.debug('Sending voice websocket frame: %s.', data)
-        await self.ws.send_str(utils._to_json(data))
+        await self.ws.send_str(_to_json(data))
 
     send_heartbeat = send_as_json
 
@@ -994,10 +1013,11 @@ class DiscordVoiceWebSocket:
 
         # the ip is ascii starting at the 8th byte and ending at the first null
         ip_start = 8
-        ip_end = recv.index(0, ip_start)
+        ip_end = recv.find(0, ip_start)
         ip = recv[ip_start:ip_end].decode('ascii')
 
-        port = struct.unpack_from('>H', recv, len(recv) - 2)[0]
+        # the port is a big endian unsigned short in the last two bytes
+        port = int.from_bytes(recv[-2:], 'big')
         _log.debug('detected ip: %s port: %s', ip, port)
 
         return ip, port
@@ -1030,7 +1050,7 @@ class DiscordVoiceWebSocket:
         # This exception is handled up the chain
         msg = await asyncio.wait_for(self.ws.receive(), timeout=30.0)
         if msg.type is aiohttp.WSMsgType.TEXT:
-            await self.received_message(utils._from_json(msg.data))
+            await self.received_message(_from_json(msg.data))
         elif msg.type is aiohttp.WSMsgType.ERROR:
             _log.debug('Received voice %s', msg)
             raise ConnectionClosed(self.ws, shard_id=None) from msg.data
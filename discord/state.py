@@ -47,7 +47,6 @@ from typing import (
     overload,
 )
 import weakref
-import inspect
 
 import os
 
@@ -268,9 +267,9 @@ class ConnectionState(Generic[ClientT]):
 
         self.parsers: Dict[str, Callable[[Any], None]]
         self.parsers = parsers = {}
-        for attr, func in inspect.getmembers(self):
+        for attr in dir(self):
             if attr.startswith('parse_'):
-                parsers[attr[6:].upper()] = func
+                parsers[attr[6:].upper()] = getattr(self, attr)
 
         self.clear()
 
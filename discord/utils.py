@@ -89,6 +89,12 @@ except ImportError:
 else:
     _HAS_ZSTD = True
 
+try:
+    # Intel ISA-L exposes the same API as zlib with a SIMD accelerated inflate
+    from isal import isal_zlib as _zlib  # type: ignore
+except ImportError:
+    _zlib = zlib  # type: ignore
+
 __all__ = (
     'oauth_url',
     'snowflake_time',
@@ -158,7 +164,7 @@ if TYPE_CHECKING:
     class _DecompressionContext(Protocol):
         COMPRESSION_TYPE: str
 
-        def decompress(self, data: bytes, /) -> str | None:
+        def decompress(self, data: bytes, /) -> bytes | None:
             ...
 
     P = ParamSpec('P')
@@ -1451,9 +1457,10 @@ if _HAS_ZSTD:
             decompressor = zstandard.ZstdDecompressor()
             self.context = decompressor.decompressobj()
 
-        def decompress(self, data: bytes, /) -> str | None:
+        def decompress(self, data: bytes, /) -> bytes | None:
             # Each WS message is a complete gateway message
-            return self.context.decompress(data).decode('utf-8')
+            # The JSON parser accepts bytes so skip the UTF-8 decode pass
+            return self.context.decompress(data)
 
     _ActiveDecompressionContext: Type[_DecompressionContext] = _ZstdDecompressionContext
 else:
@@ -1465,9 +1472,9 @@ else:
 
         def __init__(self) -> None:
             self.buffer: bytearray = bytearray()
-            self.context = zlib.decompressobj()
+            self.context = _zlib.decompressobj()
 
-        def decompress(self, data: bytes, /) -> str | None:
+        def decompress(self, data: bytes, /) -> bytes | None:
             self.buffer.extend(data)
 
             # Check whether ending is Z_SYNC_FLUSH
@@ -1475,9 +1482,11 @@ else:
                 return
 
             msg = self.context.decompress(self.buffer)
-            self.buffer = bytearray()
+            # Clear in place to reuse the allocation for the next message
+            del self.buffer[:]
 
-            return msg.decode('utf-8')
+            # The JSON parser accepts bytes so skip the UTF-8 decode pass
+            return msg
 
     _ActiveDecompressionContext: Type[_DecompressionContext] = _ZlibDecompressionContext
 
@@ -58,6 +58,7 @@ if TYPE_CHECKING:
 has_nacl: bool
 
 try:
+    import nacl.bindings  # type: ignore
     import nacl.secret  # type: ignore
     import nacl.utils  # type: ignore
 
@@ -73,6 +74,15 @@ __all__ = (
 
 _log = logging.getLogger(__name__)
 
+# Precompiled so the hot packet path skips the format-string parse and
+# module-level cache lookup inside struct.pack_into
+_USHORT_BE = struct.Struct('>H')
+_UINT_BE = struct.Struct('>I')
+
+# 20ms of 48kHz audio; hoisted so the per-frame send path skips two
+# attribute hops into the opus module
+_SAMPLES_PER_FRAME = opus.Encoder.SAMPLES_PER_FRAME
+
 
 class VoiceProtocol:
     """A class that represents the Discord voice protocol.
@@ -231,6 +241,19 @@ class VoiceClient(VoiceProtocol):
         self._player: Optional[AudioPlayer] = None
         self.encoder: Encoder = MISSING
         self._incr_nonce: int = 0
+        # Cipher state cached per secret key so it isn't rebuilt per packet
+        self._cipher_key: Optional[bytes] = None
+        self._cipher_key_source: Optional[List[int]] = None
+
+        # Reusable per-packet buffers to avoid two allocations per frame.
+        # The static RTP version/payload-type bytes are written once here.
+        self._rtp_header: bytearray = bytearray(12)
+        self._rtp_header[0] = 0x80
+        self._rtp_header[1] = 0x78
+        # The header-prefixed and counter-prefixed nonces get separate
+        # buffers so a mode change can never leave stale bytes behind
+        self._nonce_buffer: bytearray = bytearray(24)
+        self._lite_nonce_buffer: bytearray = bytearray(24)
 
         self._connection: VoiceConnectionState = self.create_connection_state()
 
@@ -284,13 +307,6 @@ class VoiceClient(VoiceProtocol):
     def timeout(self) -> float:
         return self._connection.timeout
 
-    def checked_add(self, attr: str, value: int, limit: int) -> None:
-        val = getattr(self, attr)
-        if val + value > limit:
-            setattr(self, attr, 0)
-        else:
-            setattr(self, attr, val + value)
-
     # connection related
 
     def create_connection_state(self) -> VoiceConnectionState:
@@ -369,57 +385,65 @@ class VoiceClient(VoiceProtocol):
     # audio related
 
     def _get_voice_packet(self, data):
-        header = bytearray(12)
+        header = self._rtp_header
 
-        # Formulate rtp header
-        header[0] = 0x80
-        header[1] = 0x78
-        struct.pack_into('>H', header, 2, self.sequence)
-        struct.pack_into('>I', header, 4, self.timestamp)
-        struct.pack_into('>I', header, 8, self.ssrc)
+        # Formulate rtp header; the version and payload type are static
+        _USHORT_BE.pack_into(header, 2, self.sequence)
+        _UINT_BE.pack_into(header, 4, self.timestamp)
+        _UINT_BE.pack_into(header, 8, self.ssrc)
 
         encrypt_packet = getattr(self, '_encrypt_' + self.mode)
         return encrypt_packet(header, data)
 
+    def _get_cipher_key(self) -> bytes:
+        # The immutable key bytes are cached so the per-packet cost is a
+        # single identity check rather than a list-to-bytes conversion
+        key = self.secret_key
+        if self._cipher_key is None or self._cipher_key_source is not key:
+            self._cipher_key = bytes(key)
+            self._cipher_key_source = key
+        return self._cipher_key
+
     def _encrypt_aead_xchacha20_poly1305_rtpsize(self, header: bytes, data) -> bytes:
         # Esentially the same as _lite
         # Uses an incrementing 32-bit integer which is appended to the payload
         # The only other difference is we require AEAD with Additional Authenticated Data (the header)
-        box = nacl.secret.Aead(bytes(self.secret_key))
-        nonce = bytearray(24)
+        nonce = self._lite_nonce_buffer
 
-        nonce[:4] = struct.pack('>I', self._incr_nonce)
-        self.checked_add('_incr_nonce', 1, 4294967295)
+        nonce[:4] = _UINT_BE.pack(self._incr_nonce)
+        self._incr_nonce = (self._incr_nonce + 1) & 0xFFFFFFFF
 
-        return header + box.encrypt(bytes(data), bytes(header), bytes(nonce)).ciphertext + nonce[:4]
+        # The low level binding returns just ciphertext+tag, skipping the
+        # EncryptedMessage wrapper and its nonce-stripping slice copy
+        ciphertext = nacl.bindings.crypto_aead_xchacha20poly1305_ietf_encrypt(
+            bytes(data), bytes(header), bytes(nonce), self._get_cipher_key()
+        )
+        return b''.join((header, ciphertext, nonce[:4]))
 
     def _encrypt_xsalsa20_poly1305(self, header: bytes, data) -> bytes:
         # Deprecated. Removal: 18th Nov 2024. See:
         # https://discord.com/developers/docs/topics/voice-connections#transport-encryption-modes
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-        nonce = bytearray(24)
+        nonce = self._nonce_buffer
         nonce[:12] = header
 
-        return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext
+        return b''.join((header, nacl.bindings.crypto_secretbox(bytes(data), bytes(nonce), self._get_cipher_key())))
 
     def _encrypt_xsalsa20_poly1305_suffix(self, header: bytes, data) -> bytes:
         # Deprecated. Removal: 18th Nov 2024. See:
         # https://discord.com/developers/docs/topics/voice-connections#transport-encryption-modes
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
         nonce = nacl.utils.random(nacl.secret.SecretBox.NONCE_SIZE)
 
-        return header + box.encrypt(bytes(data), nonce).ciphertext + nonce
+        return b''.join((header, nacl.bindings.crypto_secretbox(bytes(data), nonce, self._get_cipher_key()), nonce))
 
     def _encrypt_xsalsa20_poly1305_lite(self, header: bytes, data) -> bytes:
         # Deprecated. Removal: 18th Nov 2024. See:
         # https://discord.com/developers/docs/topics/voice-connections#transport-encryption-modes
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-        nonce = bytearray(24)
+        nonce = self._lite_nonce_buffer
 
-        nonce[:4] = struct.pack('>I', self._incr_nonce)
-        self.checked_add('_incr_nonce', 1, 4294967295)
+        nonce[:4] = _UINT_BE.pack(self._incr_nonce)
+        self._incr_nonce = (self._incr_nonce + 1) & 0xFFFFFFFF
 
-        return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext + nonce[:4]
+        return b''.join((header, nacl.bindings.crypto_secretbox(bytes(data), bytes(nonce), self._get_cipher_key()), nonce[:4]))
 
     def play(
         self,
@@ -577,9 +601,9 @@ class VoiceClient(VoiceProtocol):
             Encoding the data failed.
         """
 
-        self.checked_add('sequence', 1, 65535)
+        self.sequence = (self.sequence + 1) & 0xFFFF
         if encode:
-            encoded_data = self.encoder.encode(data, self.encoder.SAMPLES_PER_FRAME)
+            encoded_data = self.encoder.encode(data, _SAMPLES_PER_FRAME)
         else:
             encoded_data = data
         packet = self._get_voice_packet(encoded_data)
@@ -588,4 +612,4 @@ class VoiceClient(VoiceProtocol):
         except OSError:
             _log.debug('A packet has been dropped (seq: %s, timestamp: %s)', self.sequence, self.timestamp)
 
-        self.checked_add('timestamp', opus.Encoder.SAMPLES_PER_FRAME, 4294967295)
+        self.timestamp = (self.timestamp + _SAMPLES_PER_FRAME) & 0xFFFFFFFF
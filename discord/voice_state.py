@@ -39,8 +39,8 @@ Some documentation to refer to:
 
 from __future__ import annotations
 
-import select
 import socket
+import selectors
 import asyncio
 import logging
 import threading
@@ -48,7 +48,7 @@ import threading
 from typing import TYPE_CHECKING, Optional, Dict, List, Callable, Coroutine, Any, Tuple
 
 from .enums import Enum
-from .utils import MISSING, sane_wait_for
+from .utils import MISSING
 from .errors import ConnectionClosed
 from .backoff import ExponentialBackoff
 from .gateway import DiscordVoiceWebSocket
@@ -80,24 +80,32 @@ class SocketReader(threading.Thread):
         super().__init__(daemon=True, name=f'voice-socket-reader:{id(self):#x}')
         self.state: VoiceConnectionState = state
         self.start_paused = start_paused
-        self._callbacks: List[SocketReaderCallback] = []
+        # Copy-on-write snapshot: mutated only by replacement from the event
+        # loop thread, so the reader thread can iterate it without a lock
+        self._callbacks: Tuple[SocketReaderCallback, ...] = ()
         self._running = threading.Event()
         self._end = threading.Event()
+        # The selector outlives any one socket; registration tracks the
+        # socket object currently installed on the state
+        self._selector = selectors.DefaultSelector()
+        self._registered: Optional[socket.socket] = None
         # If we have paused reading due to having no callbacks
         self._idle_paused: bool = True
 
     def register(self, callback: SocketReaderCallback) -> None:
-        self._callbacks.append(callback)
+        self._callbacks = self._callbacks + (callback,)
         if self._idle_paused:
             self._idle_paused = False
             self._running.set()
 
     def unregister(self, callback: SocketReaderCallback) -> None:
+        callbacks = self._callbacks
         try:
-            self._callbacks.remove(callback)
+            index = callbacks.index(callback)
         except ValueError:
             pass
         else:
+            self._callbacks = callbacks[:index] + callbacks[index + 1 :]
             if not self._callbacks and self._running.is_set():
                 # If running is not set, we are either explicitly paused and
                 # should be explicitly resumed, or we are already idle paused
@@ -135,7 +143,8 @@ class SocketReader(threading.Thread):
         finally:
             self.stop()
             self._running.clear()
-            self._callbacks.clear()
+            self._callbacks = ()
+            self._selector.close()
 
     def _do_run(self) -> None:
         while not self._end.is_set():
@@ -143,9 +152,24 @@ class SocketReader(threading.Thread):
                 self._running.wait()
                 continue
 
-            # Since this socket is a non blocking socket, select has to be used to wait on it for reading.
+            # Bound to a local so that select and recv are guaranteed to hit
+            # the same socket even if the state swaps it out mid-wakeup, and
+            # so the drain loop skips the attribute chain per datagram
+            sock = self.state.socket
+
+            # Since this socket is a non blocking socket, the selector has to be used to wait on it for reading.
+            # The socket is re-registered whenever a reconnect replaces it.
             try:
-                readable, _, _ = select.select([self.state.socket], [], [], 30)
+                if sock is not self._registered:
+                    if self._registered is not None:
+                        try:
+                            self._selector.unregister(self._registered)
+                        except (KeyError, ValueError, OSError):
+                            pass
+                        self._registered = None
+                    self._selector.register(sock, selectors.EVENT_READ)
+                    self._registered = sock
+                readable = self._selector.select(30)
             except (ValueError, TypeError, OSError) as e:
                 _log.debug(
                     "Select error handling socket in reader, this should be safe to ignore: %s: %s", e.__class__.__name__, e
@@ -156,11 +180,18 @@ class SocketReader(threading.Thread):
             if not readable:
                 continue
 
-            try:
-                data = self.state.socket.recv(2048)
-            except OSError:
-                _log.debug('Error reading from socket in %s, this should be safe to ignore', self, exc_info=True)
-            else:
+            recv = sock.recv
+            # Drain every datagram the kernel has queued so a burst of
+            # packets costs a single select round trip instead of one each
+            while True:
+                try:
+                    data = recv(2048)
+                except BlockingIOError:
+                    break
+                except OSError:
+                    _log.debug('Error reading from socket in %s, this should be safe to ignore', self, exc_info=True)
+                    break
+
                 for cb in self._callbacks:
                     try:
                         cb(data)
@@ -187,6 +218,36 @@ class ConnectionFlowState(Enum):
 class VoiceConnectionState:
     """Represents the internal state of a voice connection."""
 
+    __slots__ = (
+        'voice_client',
+        'hook',
+        'timeout',
+        'reconnect',
+        'self_deaf',
+        'self_mute',
+        'token',
+        'session_id',
+        'endpoint',
+        'endpoint_ip',
+        'server_id',
+        'ip',
+        'port',
+        'voice_port',
+        'secret_key',
+        'ssrc',
+        'mode',
+        'socket',
+        'ws',
+        '_state',
+        '_expecting_disconnect',
+        '_connected',
+        '_state_future',
+        '_disconnected',
+        '_runner',
+        '_connector',
+        '_socket_reader',
+    )
+
     def __init__(self, voice_client: VoiceClient, *, hook: Optional[WebsocketHook] = None) -> None:
         self.voice_client = voice_client
         self.hook = hook
@@ -212,7 +273,9 @@ class VoiceConnectionState:
         self._state: ConnectionFlowState = ConnectionFlowState.disconnected
         self._expecting_disconnect: bool = False
         self._connected = threading.Event()
-        self._state_event = asyncio.Event()
+        # Resolved and replaced on every state transition; waiters hold the
+        # current future so a transition can never be missed between checks
+        self._state_future: asyncio.Future[None] = voice_client.loop.create_future()
         self._disconnected = asyncio.Event()
         self._runner: Optional[asyncio.Task] = None
         self._connector: Optional[asyncio.Task] = None
@@ -228,8 +291,10 @@ class VoiceConnectionState:
         if state is not self._state:
             _log.debug('Connection state changed to %s', state.name)
         self._state = state
-        self._state_event.set()
-        self._state_event.clear()
+        future = self._state_future
+        self._state_future = self.voice_client.loop.create_future()
+        if not future.done():
+            future.set_result(None)
 
         if state is ConnectionFlowState.connected:
             self._connected.set()
@@ -536,7 +601,9 @@ class VoiceConnectionState:
         return self.state is ConnectionFlowState.connected
 
     def send_packet(self, packet: bytes) -> None:
-        self.socket.sendall(packet)
+        # A connected UDP send is all-or-nothing, so sendall's pure-Python
+        # short-write loop is dead weight on the per-frame path
+        self.socket.send(packet)
 
     def add_socket_listener(self, callback: SocketReaderCallback) -> None:
         _log.debug('Registering socket listener callback %s', callback)
@@ -553,10 +620,9 @@ class VoiceConnectionState:
         self, state: ConnectionFlowState, *other_states: ConnectionFlowState, timeout: Optional[float] = None
     ) -> None:
         states = (state, *other_states)
-        while True:
-            if self.state in states:
-                return
-            await sane_wait_for([self._state_event.wait()], timeout=timeout)
+        while self.state not in states:
+            # The shield keeps a timeout from cancelling the shared future
+            await asyncio.wait_for(asyncio.shield(self._state_future), timeout=timeout)
 
     async def _voice_connect(self, *, self_deaf: bool = False, self_mute: bool = False) -> None:
         channel = self.voice_client.channel
@@ -579,16 +645,32 @@ class VoiceConnectionState:
         return ws
 
     async def _handshake_websocket(self) -> None:
-        while not self.ip:
-            await self.ws.poll_event()
-        self.state = ConnectionFlowState.got_ip_discovery
+        # READY (and with it IP discovery) always precedes SESSION_DESCRIPTION,
+        # so a single loop keyed on the secret key covers both waits
         while self.ws.secret_key is None:
             await self.ws.poll_event()
+            if self.ip and self.state is not ConnectionFlowState.got_ip_discovery:
+                self.state = ConnectionFlowState.got_ip_discovery
         self.state = ConnectionFlowState.connected
 
     def _create_socket(self) -> None:
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.socket.setblocking(False)
+
+        try:
+            # The default UDP buffers can be small enough to drop packets when
+            # the sender thread is briefly stalled (GC pauses, a contested GIL)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        except OSError:
+            _log.debug('Could not raise voice socket buffer sizes, using defaults', exc_info=True)
+
+        try:
+            # Mark the flow as expedited forwarding (DSCP EF) for QoS-aware networks
+            self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, 0xB8)
+        except OSError:
+            _log.debug('Could not set IP_TOS on voice socket', exc_info=True)
+
         self._socket_reader.resume()
 
     async def _poll_voice_ws(self, reconnect: bool) -> None: